@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from web_app.time_series import time_series_columns, build_time_series_aggregates, lttb_indices
+
+
+def make_series(n):
+    x = pd.date_range('2014-01-01', periods=n, freq='D').asi8
+    y = np.sin(np.linspace(0, 20, n)) * 50 + 50
+    return x, y
+
+
+@pytest.mark.parametrize('n, threshold', [(1000, 100), (1000, 3), (10, 9), (3653, 500)])
+def test_lttb_returns_threshold_increasing_indices(n, threshold):
+    x, y = make_series(n)
+    indices = lttb_indices(x, y, threshold)
+
+    assert len(indices) == threshold
+    assert (np.diff(indices) > 0).all()
+    assert indices[0] == 0
+    assert indices[-1] == n - 1
+
+
+@pytest.mark.parametrize('threshold', [50, 51])
+def test_lttb_passes_through_when_threshold_not_below_length(threshold):
+    x, y = make_series(50)
+
+    np.testing.assert_array_equal(lttb_indices(x, y, threshold), np.arange(50))
+
+
+def test_rolling_windows_do_not_span_missing_days():
+    dates = pd.date_range('2014-04-01', '2014-04-10', freq='D').append(
+        pd.date_range('2014-05-20', '2014-05-30', freq='D'))
+    df = pd.DataFrame({'datetime': dates})
+    for col in time_series_columns:
+        df[col] = 1.0
+    df.loc[df['datetime'] < '2014-05-01', 'AQI Value'] = 100.0
+
+    rolling_7d = build_time_series_aggregates(df)['rolling_7d']
+
+    assert rolling_7d.loc['2014-05-20':, 'AQI Value'].eq(1.0).all()
+    assert pd.Timestamp('2014-05-21') not in rolling_7d.index
@@ -11,6 +11,7 @@ import json
 import base64
 from google.oauth2 import service_account
 from google.cloud import storage
+from .time_series import time_series_columns, time_series_resolutions, build_time_series_aggregates, lttb_indices
 
 main = Blueprint('main', __name__)
 
@@ -65,6 +66,10 @@ def load_historical_data_from_gcs(bucket_name, historical_data_file_path):
 model = load_model_from_gcs(bucket_name, model_file_path)
 historical_data = load_historical_data_from_gcs(bucket_name, historical_data_file_path)
 
+time_series_aggregates = build_time_series_aggregates(historical_data)
+default_time_series_points = 500
+max_time_series_points = 5000
+
 
 def prepare_input_data(selected_date):
     date_obj = datetime.strptime(selected_date, '%Y-%m-%d')
@@ -192,6 +197,52 @@ def plot_aqi_over_time_route():
         return jsonify({"error": "Failed to generate AQI over time plot"}), 500
 
 
+@main.route('/aqi_time_series', methods=['GET'])
+def aqi_time_series_route():
+    resolution = request.args.get('resolution', 'daily')
+    if resolution not in time_series_resolutions:
+        return jsonify({"error": f"Unknown resolution '{resolution}'"}), 400
+
+    try:
+        start = parse_time_series_date(request.args.get('start'))
+        end = parse_time_series_date(request.args.get('end'))
+        points = int(request.args.get('points', default_time_series_points))
+    except ValueError:
+        return jsonify({"error": "Invalid start, end or points parameter"}), 400
+
+    if points < 3:
+        return jsonify({"error": "points must be at least 3"}), 400
+    points = min(points, max_time_series_points)
+
+    try:
+        df = time_series_aggregates[resolution]
+        df = df.loc[start:end]
+
+        if len(df) > points:
+            df = df.iloc[lttb_indices(df.index.asi8, df['AQI Value'].to_numpy(), points)]
+
+        return jsonify({
+            'resolution': resolution,
+            'datetime': df.index.strftime('%Y-%m-%d').tolist(),
+            'series': {col: df[col].round(2).tolist() for col in time_series_columns}
+        })
+    except Exception as e:
+        print(f"Error generating AQI time series: {e}")
+        return jsonify({"error": "Failed to generate AQI time series"}), 500
+
+
+def parse_time_series_date(value):
+    if not value:
+        return None
+
+    date = pd.to_datetime(value)
+    if pd.isna(date):
+        raise ValueError(f"Invalid date '{value}'")
+    if date.tzinfo is not None:
+        date = date.tz_convert(None)
+    return date
+
+
 def clean_non_numeric(df):
     df['AQI Value'] = pd.to_numeric(df['AQI Value'], errors='coerce')
 
@@ -0,0 +1,55 @@
+import pandas as pd
+import numpy as np
+
+time_series_columns = ['AQI Value', 'temp_mean', 'humidity_mean', 'wind_speed_mean', 'pressure_mean', 'clouds_all_mean']
+time_series_resolutions = ['daily', 'weekly', 'monthly', 'rolling_7d', 'rolling_30d']
+
+
+def build_time_series_aggregates(df):
+    df = df[['datetime'] + time_series_columns].copy()
+    for col in time_series_columns:
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    df.dropna(subset=time_series_columns, inplace=True)
+
+    daily = df.groupby(df['datetime'].dt.normalize())[time_series_columns].mean().sort_index()
+    daily.index.name = 'datetime'
+
+    # Weekly and monthly points are labelled by the first day of their period. Rolling windows are
+    # calendar based so missing days shrink the window instead of pulling in older readings.
+    return {
+        'daily': daily,
+        'weekly': daily.resample('W-MON', label='left', closed='left').mean().dropna(),
+        'monthly': daily.resample('MS').mean().dropna(),
+        'rolling_7d': daily.rolling('7D', min_periods=4).mean().dropna(),
+        'rolling_30d': daily.rolling('30D', min_periods=15).mean().dropna()
+    }
+
+
+def lttb_indices(x, y, threshold):
+    # Largest-Triangle-Three-Buckets: keeps the first and last points and, for each bucket in between,
+    # the point forming the largest triangle with the previous pick and the next bucket's average.
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    bucket_edges = np.linspace(1, n - 1, threshold - 1).astype(int)
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+
+    for i in range(threshold - 2):
+        start, end = bucket_edges[i], bucket_edges[i + 1]
+        next_start = end
+        next_end = bucket_edges[i + 2] if i + 2 < len(bucket_edges) else n
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(areas))
+        indices[i + 1] = a
+
+    return indices